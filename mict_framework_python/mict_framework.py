@@ -1,9 +1,106 @@
 # mict-framework.py
 
+import copy
+import heapq
+import itertools
+import logging
+import sys
 import time
 import threading
+from collections import OrderedDict
 from typing import Callable, Dict, List, Optional, Any, Union
 
+_logger = logging.getLogger(__name__)
+
+_CACHE_MISS = object()  # Sentinel: distinguishes "not cached" from a cached None.
+_STAGE_ERROR = object()  # Sentinel: a guarded stage function raised; error already handled.
+
+def _default_error_handler(error: Exception, current_stage: str, state: Any) -> None:
+    """Default error handler: logs with deferred formatting, no stdout I/O."""
+    _logger.error("Error in stage '%s': %s", current_stage, error)
+
+def _snapshot(state: Any) -> Any:
+    """Returns a shallow snapshot of a state container (dict or schema object)."""
+    if isinstance(state, dict):
+        return state.copy()
+    return copy.copy(state)
+
+class _ScheduledTick:
+    """Handle for a periodic tick registered with the shared scheduler."""
+    __slots__ = ('callback', 'period', 'deadline', 'cancelled')
+
+    def __init__(self, callback: Callable[[], None], period: float):
+        self.callback = callback
+        self.period = period
+        self.deadline = time.monotonic() + period
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+class _SharedScheduler:
+    """
+    A single daemon thread that drives the cycles of many MICT instances.
+
+    A dedicated thread per MICT costs a kernel stack and a GIL wakeup each;
+    instances using scheduler='shared' instead register a periodic tick here,
+    and one thread services all of them from a heap of monotonic deadlines.
+    """
+    def __init__(self):
+        self._wakeup = threading.Condition()
+        self._heap: List = []  # (deadline, sequence, _ScheduledTick)
+        self._counter = itertools.count()  # Tie-breaker for equal deadlines.
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, callback: Callable[[], None], period: float) -> _ScheduledTick:
+        """Registers a callback to run every `period` seconds; returns its handle."""
+        tick = _ScheduledTick(callback, period)
+        with self._wakeup:
+            heapq.heappush(self._heap, (tick.deadline, next(self._counter), tick))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+        return tick
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                while True:
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._wakeup.wait()
+                        continue
+                    deadline = self._heap[0][0]
+                    delay = deadline - time.monotonic()
+                    if delay > 0:
+                        self._wakeup.wait(delay)
+                        continue
+                    _, _, tick = heapq.heappop(self._heap)
+                    tick.deadline = deadline + tick.period
+                    heapq.heappush(self._heap, (tick.deadline, next(self._counter), tick))
+                    break
+            # Run the callback outside the lock so one slow or failing
+            # instance cannot block scheduling (or bring down) the others.
+            try:
+                tick.callback()
+            except Exception as error:
+                # Deferred-formatting log, not print: a blocking stdout write
+                # here would stall every shared-mode instance in the process.
+                _logger.error("Error in shared MICT scheduler tick: %s", error)
+
+_shared_scheduler: Optional[_SharedScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+def _get_shared_scheduler() -> _SharedScheduler:
+    """Returns the lazily-created process-wide scheduler."""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = _SharedScheduler()
+        return _shared_scheduler
+
 class MICTError(Exception):
     """Base class for MICT-related errors."""
     pass
@@ -21,16 +118,43 @@ class MICT:
 
     Attributes:
         stages (list): A list of stage names (strings) defining the MICT cycle.
-        current_state (dict): The current state of the system.
-        previous_state (dict): The previous state of the system.
+        state_schema (type or None): Optional class used as the state container
+            instead of a dict (typically a slots dataclass).
+        state_dtype: Optional numpy dtype; the state is then held as a packed
+            one-element structured array instead of a dict.
+        current_state (dict or object): The current state of the system.
+        previous_state (dict or object): The previous state of the system.
         current_stage_index (int): The index of the current stage in the `stages` list.
         updateUI (callable): A function to call for updating the user interface.
         stage_functions (dict): A dictionary mapping stage names to functions.
         interval_id (threading.Timer or None): The ID of the background thread (if running).
         interval (int): The interval (in milliseconds) between cycle iterations.
+        batch (int): Number of stages executed back-to-back per timer wakeup.
+        scheduler (str): 'thread' runs the cycle on a dedicated thread;
+            'shared' runs it on the process-wide scheduler thread.
+        update_ui_on_change_only (bool): If True, updateUI fires only when a
+            stage produced a new state object (see force_redraw).
         error_handler (callable or None): A function to call for handling errors.
+        jit (bool): Whether stage functions are compiled to native code via numba.
+        pure_stages (set): Names of stages whose functions are memoized.
+        nothrow_stages (set): Names of stages dispatched without an error
+            guard; exceptions from them propagate to the caller.
+        cache_size (int): Maximum entries per pure-stage memoization cache.
         config (dict):  Stores the original configuration
     """
+    # Fixed attribute layout: drops the per-instance __dict__ (~300 B each)
+    # and turns every self.foo access into a C-level slot offset load.
+    __slots__ = (
+        'stages', 'state_schema', 'state_dtype', 'current_state', 'previous_state',
+        'current_stage_index', 'updateUI', 'stage_functions', 'interval_id',
+        'interval', 'error_handler', '_error_handler', 'jit', 'batch',
+        'pure_stages', 'nothrow_stages', 'cache_size', 'scheduler',
+        'update_ui_on_change_only', '_stopped', '_stop_event', '_tick_handle',
+        '_stage_caches', '_stage_cache_info', '_compiled_cycle',
+        '_stage_name_by_idx', '_stage_fn_by_idx', '_n_stages', '_next_idx',
+        'config',
+    )
+
     def __init__(self, config: Dict):
         if not isinstance(config, dict):
             raise TypeError("MICT constructor requires a configuration object.")
@@ -39,16 +163,49 @@ class MICT:
         if not callable(config.get('updateUI')):
             raise TypeError("MICT configuration must include an 'updateUI' function.")
 
-        self.stages: List[str] = config['stages']
-        self.current_state: Dict = config.get('initialState', {})  # Default to empty dict if not provided
-        self.previous_state: Optional[Dict] = None  # Initialize previous_state
+        # Intern the stage names: equality checks and dict lookups on them
+        # then short-circuit on pointer identity. Runtime-built names (e.g.
+        # read from a config file) are not interned by CPython automatically.
+        self.stages: List[str] = [sys.intern(stage) for stage in config['stages']]
+        self.state_schema: Optional[type] = config.get('stateSchema', None)
+        if self.state_schema is not None and not isinstance(self.state_schema, type):
+            raise TypeError("MICT 'stateSchema' must be a class (e.g. a slots dataclass).")
+        self.state_dtype: Any = config.get('stateDtype', None)
+        if self.state_dtype is not None and self.state_schema is not None:
+            raise TypeError("MICT 'stateSchema' and 'stateDtype' are mutually exclusive.")
+        self.current_state: Any = self._build_initial_state(config)
+        self.previous_state: Optional[Any] = None  # Initialize previous_state
         self.current_stage_index: int = 0
         self.updateUI: Callable[[Dict, str], None] = config['updateUI']
-        self.stage_functions: Dict[str, Callable] = config.get('stageFunctions', {})  # Default to empty dict
+        self.stage_functions: Dict[str, Callable] = {
+            sys.intern(name): func for name, func in config.get('stageFunctions', {}).items()
+        }
         self.interval_id: Optional[threading.Timer] = None
         self.interval: int = config.get('interval', 0)  # Default to 0 (no interval)
         self.error_handler: Optional[Callable[[Exception, str, Dict], None]] = config.get('errorHandler', None)
+        # Pre-bound handler: the per-error "is one configured?" branch and the
+        # blocking print fallback are resolved once here instead of per tick.
+        self._error_handler: Callable[[Exception, str, Any], None] = self.error_handler or _default_error_handler
+        self.jit: bool = config.get('jit', False)
+        self.batch: int = config.get('batch', 1)
+        if not isinstance(self.batch, int) or self.batch < 1:
+            raise TypeError("MICT 'batch' must be a positive integer.")
+        self.pure_stages: set = set(config.get('pureStages', ()))
+        self.nothrow_stages: set = set(config.get('nothrowStages', ()))
+        self.cache_size: int = config.get('cacheSize', 128)
+        self.scheduler: str = config.get('scheduler', 'thread')
+        if self.scheduler not in ('thread', 'shared'):
+            raise TypeError("MICT 'scheduler' must be 'thread' or 'shared'.")
+        self.update_ui_on_change_only: bool = config.get('updateUIOnChangeOnly', False)
+        # Stop signaling is split in two: _stopped is a plain bool the cycle
+        # loop reads without any method call or locking (atomic under the
+        # GIL), while _stop_event only wakes a sleeping cycle thread early.
+        self._stopped: bool = False
         self._stop_event: threading.Event = threading.Event() # Event for stopping
+        self._tick_handle: Optional[_ScheduledTick] = None  # Shared-scheduler registration.
+        self._stage_caches: Dict[str, OrderedDict] = {}
+        self._stage_cache_info: Dict[str, Dict[str, int]] = {}
+        self._compiled_cycle: Optional[Callable] = None  # Built lazily by start_cycle.
 
         # Validate stageFunctions
         for stage_name, func in self.stage_functions.items():
@@ -57,8 +214,146 @@ class MICT:
             if not callable(func):
                 raise TypeError(f"stageFunctions['{stage_name}'] must be a function.")
 
+        for stage_name in self.pure_stages:
+            if stage_name not in self.stage_functions:
+                raise TypeError(f"Invalid stage name '{stage_name}' in pureStages. Must have an entry in stageFunctions.")
+        for stage_name in self.nothrow_stages:
+            if stage_name not in self.stages:
+                raise TypeError(f"Invalid stage name '{stage_name}' in nothrowStages. Must be one of: {', '.join(self.stages)}")
+
+        if self.jit:
+            self.stage_functions = self._compile_stage_functions(self.stage_functions)
+
+        if self.pure_stages:
+            # stage_functions is already our own dict, so wrapping in place
+            # leaves the caller's stageFunctions mapping untouched.
+            for stage_name in self.pure_stages:
+                self.stage_functions[stage_name] = self._memoize_stage_function(
+                    stage_name, self.stage_functions[stage_name]
+                )
+
+        # Precomputed index-based dispatch tables: indexing a list is a single
+        # C-level fetch, cheaper than the two dict lookups per tick that
+        # name-based dispatch would cost in next_stage. Error handling is
+        # pre-applied per slot so the hot path carries no try/except: stages
+        # in nothrowStages are stored bare, the rest get a guarding wrapper.
+        self._stage_name_by_idx: List[str] = list(self.stages)
+        self._stage_fn_by_idx: List[Optional[Callable]] = []
+        for name in self.stages:
+            fn = self.stage_functions.get(name)
+            if fn is not None and name not in self.nothrow_stages:
+                fn = self._wrap_stage_function(name, fn)
+            self._stage_fn_by_idx.append(fn)
+        self._n_stages: int = len(self.stages)
+        # Stage advance as a lookup table: the cycle length is fixed, so the
+        # per-tick (idx + 1) % n reduces to one list index.
+        self._next_idx: List[int] = [(i + 1) % self._n_stages for i in range(self._n_stages)]
+
         self.config = config #Store for later use.
 
+    def _build_initial_state(self, config: Dict) -> Any:
+        """
+        Builds the initial state from the configuration.
+
+        Without a 'stateSchema' this is simply the 'initialState' dict. With a
+        schema class, the initial state becomes an instance of it: attribute
+        access on a slots class is a fixed offset load with no hashing, and
+        in-place updates (state.count += 1) avoid rebuilding a dict per tick.
+        With a 'stateDtype', it becomes a one-element numpy structured array:
+        fields declared at their actual width (e.g. "<u1" for a small counter)
+        pack the whole state into a few bytes, and snapshots are one memcpy.
+        """
+        initial = config.get('initialState')
+        if self.state_dtype is not None:
+            try:
+                import numpy as np
+            except ImportError as exc:
+                raise ConfigurationError(
+                    "MICT was configured with 'stateDtype', but the optional 'numpy' "
+                    "package is not installed. Install numpy or remove the option."
+                ) from exc
+            state = np.zeros(1, dtype=self.state_dtype)
+            if isinstance(initial, dict):
+                for field, value in initial.items():
+                    state[field] = value
+            elif initial is not None:
+                return np.array(initial, dtype=self.state_dtype)
+            return state
+        if self.state_schema is None:
+            return initial if initial is not None else {}
+        if isinstance(initial, self.state_schema):
+            return copy.copy(initial)
+        if isinstance(initial, dict):
+            return self.state_schema(**initial)
+        if initial is None:
+            return self.state_schema()
+        raise TypeError("MICT 'initialState' must be a dict or an instance of the 'stateSchema' class.")
+
+    @staticmethod
+    def _compile_stage_functions(stage_functions: Dict[str, Callable]) -> Dict[str, Callable]:
+        """
+        Compiles stage functions to native code using numba.
+
+        Compilation is lazy: each function is compiled on its first call, and
+        the compiled machine code is cached on disk (cache=True) so later runs
+        skip the warm-up. Stage functions must be numba nopython-compatible
+        (e.g. operate on scalars or numba typed containers, not plain dicts).
+
+        Raises:
+            ConfigurationError: If numba is not installed.
+        """
+        try:
+            from numba import njit
+        except ImportError as exc:
+            raise ConfigurationError(
+                "MICT was configured with jit=True, but the optional 'numba' package "
+                "is not installed. Install numba or remove the 'jit' option."
+            ) from exc
+        return {name: njit(cache=True)(func) for name, func in stage_functions.items()}
+
+    def _memoize_stage_function(self, stage_name: str, func: Callable) -> Callable:
+        """
+        Wraps a pure stage function with a bounded LRU cache.
+
+        The cache key is a frozenset of the state's items, so all state values
+        must be hashable. Cached results are stored and returned as shallow
+        copies so callers mutating the state afterwards cannot corrupt cache
+        entries.
+        """
+        cache: OrderedDict = OrderedDict()
+        info = {'hits': 0, 'misses': 0}
+        maxsize = self.cache_size
+        self._stage_caches[stage_name] = cache
+        self._stage_cache_info[stage_name] = info
+
+        def memoized(state: Dict) -> Optional[Dict]:
+            key = frozenset(state.items())
+            cached = cache.get(key, _CACHE_MISS)
+            if cached is not _CACHE_MISS:
+                info['hits'] += 1
+                cache.move_to_end(key)
+                return None if cached is None else cached.copy()
+            info['misses'] += 1
+            result = func(state)
+            cache[key] = None if result is None else result.copy()
+            if len(cache) > maxsize:
+                cache.popitem(last=False)  # Evict the least recently used entry.
+            return result
+
+        return memoized
+
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        """Returns hit/miss/size statistics for each memoized pure stage."""
+        return {
+            name: {
+                'hits': info['hits'],
+                'misses': info['misses'],
+                'maxsize': self.cache_size,
+                'currsize': len(self._stage_caches[name]),
+            }
+            for name, info in self._stage_cache_info.items()
+        }
+
     def get_current_stage(self) -> str:
         """Returns the name of the current stage."""
         return self.stages[self.current_stage_index]
@@ -67,32 +362,183 @@ class MICT:
         """Returns the index of the current stage."""
         return self.current_stage_index
     
-    def get_previous_state(self) -> Optional[Dict]:
+    def get_previous_state(self) -> Optional[Any]:
         """Returns the previous state of the system."""
         return self.previous_state
 
-    def next_stage(self) -> None:
-        """Executes the next stage in the MICT cycle."""
-        current_stage = self.get_current_stage()
+    def _wrap_stage_function(self, stage_name: str, func: Callable) -> Callable:
+        """
+        Pre-applies error handling to a stage function.
 
-        # Call the stage function (if it exists)
-        if current_stage in self.stage_functions:
+        The returned wrapper routes any exception to the configured error
+        handler and returns the _STAGE_ERROR sentinel, so the per-tick dispatch
+        needs no try/except of its own. Stages declared in nothrowStages skip
+        this wrapper; an exception from them propagates to the caller.
+        """
+        def guarded(state: Any) -> Any:
             try:
-                # Call stage function, potentially updating state
-                new_state = self.stage_functions[current_stage](self.current_state)
-                self.previous_state = self.current_state.copy() # Use copy to avoid modifying.
-                if new_state is not None:  # Allow for no change.
-                    self.current_state = new_state
+                return func(state)
             except Exception as error:
-                if self.error_handler:
-                    self.error_handler(error, current_stage, self.current_state)
-                else:
-                    print(f"Error in stage '{current_stage}': {error}")
+                self._handle_stage_error(error, stage_name)
+                return _STAGE_ERROR
+        return guarded
+
+    def _handle_stage_error(self, error: Exception, current_stage: str) -> None:
+        """Routes a stage-function error to the pre-bound handler."""
+        self._error_handler(error, current_stage, self.current_state)
+
+    def next_stage(self) -> None:
+        """Executes the next stage in the MICT cycle."""
+        # Hot path: pull attributes into locals once at entry and store back
+        # once at exit, instead of repeated LOAD_ATTR walks per tick.
+        idx = self.current_stage_index
+        stage_function = self._stage_fn_by_idx[idx]
+        state = self.current_state
+        changed = False
+
+        # Call the stage function (if it exists). Error handling is already
+        # baked into the dispatch slot (see _wrap_stage_function), so the hot
+        # path carries no try/except of its own.
+        if stage_function is not None:
+            # Call stage function, potentially updating state
+            new_state = stage_function(state)
+            if new_state is _STAGE_ERROR:
                 return  # Don't proceed to the next stage if there's an error
+            if new_state is not None and new_state is not state:
+                # The stage returned a fresh dict, so the old one is already
+                # detached and can be kept as-is -- no copy needed.
+                self.previous_state = state
+                state = new_state
+                self.current_state = state
+                changed = True
+            else:
+                # The stage may have mutated the state in place; snapshot to
+                # keep previous_state from aliasing current_state.
+                self.previous_state = _snapshot(state)
 
-        # Move to the next stage
-        self.current_stage_index = (self.current_stage_index + 1) % len(self.stages)
-        self.updateUI(self.current_state, self.get_current_stage())
+        # Move to the next stage via the precomputed advance table.
+        idx = self._next_idx[idx]
+        self.current_stage_index = idx
+        if changed or not self.update_ui_on_change_only:
+            self.updateUI(state, self._stage_name_by_idx[idx])
+
+    def compile_stages_aot(self, signatures: Dict[str, str], module_name: str = 'mict_stages',
+                           output_dir: Optional[str] = None) -> None:
+        """
+        Ahead-of-time compiles the stage functions into a shared object.
+
+        Unlike jit=True, which pays the numba compile cost on each process's
+        first call, this emits an importable extension module on disk so
+        production processes start with zero JIT warm-up -- load it with
+        use_compiled_stages().
+
+        Args:
+            signatures (dict): Maps stage names to numba signature strings
+                (e.g. "int64(int64)") describing each stage function.
+            module_name (str): Name of the generated extension module.
+            output_dir (str, optional): Directory for the build output.
+
+        Raises:
+            ConfigurationError: If numba (or its AOT compiler) is not installed.
+        """
+        try:
+            from numba.pycc import CC
+        except ImportError as exc:
+            raise ConfigurationError(
+                "Ahead-of-time compilation requires the optional 'numba' package "
+                "with AOT support (numba.pycc)."
+            ) from exc
+        cc = CC(module_name)
+        if output_dir is not None:
+            cc.output_dir = output_dir
+        for stage_name, func in self.stage_functions.items():
+            if stage_name not in signatures:
+                raise ConfigurationError(f"No AOT signature provided for stage '{stage_name}'.")
+            cc.export(stage_name, signatures[stage_name])(func)
+        cc.compile()
+
+    def use_compiled_stages(self, module: Any) -> None:
+        """
+        Replaces the stage functions with kernels from a compiled module.
+
+        The module (typically built by compile_stages_aot) must expose one
+        callable per stage name. The dispatch table and the cached cycle
+        driver are rebuilt around the compiled kernels.
+        """
+        for idx, stage_name in enumerate(self._stage_name_by_idx):
+            if self._stage_fn_by_idx[idx] is None:
+                continue
+            fn = getattr(module, stage_name)
+            self.stage_functions[stage_name] = fn
+            if stage_name not in self.nothrow_stages:
+                fn = self._wrap_stage_function(stage_name, fn)
+            self._stage_fn_by_idx[idx] = fn
+        self._compiled_cycle = None  # Regenerate the driver on next start_cycle.
+
+    def _compile_cycle_driver(self) -> Callable:
+        """
+        Generates a straight-line driver for one full pass through the cycle.
+
+        The stage list is frozen at configuration time, so the per-stage table
+        lookup, index increment, and modulo in next_stage can be specialized
+        away: the generated function literally calls the stage functions in
+        sequence, with stage names baked in as constants. Semantics mirror
+        next_stage exactly -- error handling, previous_state snapshots, and
+        the updateUI call after each stage.
+
+        The driver has the signature driver(self, pace), where pace() is
+        called between stages and returns True when a stop was requested; the
+        driver then returns True. It returns False after completing the cycle.
+        A stage error also paces once before returning (leaving
+        current_stage_index at the failing stage, just like next_stage), so a
+        persistently failing stage retries at the interval, not in a busy loop.
+        """
+        lines = ["def _cycle(self, pace):", "    updateUI = self.updateUI"]
+        namespace: Dict[str, Any] = {'_snapshot': _snapshot, '_STAGE_ERROR': _STAGE_ERROR}
+        on_change_only = self.update_ui_on_change_only
+        for idx in range(self._n_stages):
+            name = self._stage_name_by_idx[idx]
+            fn = self._stage_fn_by_idx[idx]
+            next_idx = (idx + 1) % self._n_stages
+            next_name = self._stage_name_by_idx[next_idx]
+            lines.append(f"    # Stage {name!r}")
+            lines.append("    state = self.current_state")
+            if fn is not None:
+                # The slot already carries error handling (_wrap_stage_function),
+                # so a sentinel check replaces the inlined try/except.
+                namespace[f"_fn{idx}"] = fn
+                lines.extend([
+                    f"    new_state = _fn{idx}(state)",
+                    "    if new_state is _STAGE_ERROR:",
+                    f"        self.current_stage_index = {idx}",
+                    # Pace before bailing out: without this, a persistently
+                    # failing stage at index 0 would make run_cycle re-enter
+                    # the driver in an unpaced busy loop.
+                    "        return pace()",
+                    f"    self.current_stage_index = {next_idx}",
+                    "    if new_state is not None and new_state is not state:",
+                    "        self.previous_state = state",
+                    "        state = new_state",
+                    "        self.current_state = state",
+                ])
+                if on_change_only:
+                    # Change-only mode, baked in: updateUI fires only on the
+                    # branch where the stage produced a fresh state object.
+                    lines.append(f"        updateUI(state, {next_name!r})")
+                lines.extend([
+                    "    else:",
+                    "        self.previous_state = _snapshot(state)",
+                ])
+            else:
+                lines.append(f"    self.current_stage_index = {next_idx}")
+            if not on_change_only:
+                lines.append(f"    updateUI(self.current_state, {next_name!r})")
+            lines.append("    if pace():")
+            lines.append("        return True")
+        lines.append("    return False")
+        code = compile("\n".join(lines), f"<mict cycle driver {id(self):#x}>", "exec")
+        exec(code, namespace)
+        return namespace['_cycle']
 
     def start_cycle(self, interval: Optional[int] = None) -> Optional[threading.Thread]:
         """
@@ -105,42 +551,115 @@ class MICT:
 
         Returns:
             threading.Thread or None: The thread object if the cycle is started with an interval,
-                otherwise None.
+                otherwise None. Always None with scheduler='shared', since the
+                cycle then runs on the process-wide scheduler thread.
         """
-        if self.interval_id:
+        if self.interval_id or self._tick_handle:
             print("MICT cycle is already running.  Stopping the previous cycle.")
             self.stop_cycle()
 
+        self._stopped = False
         self._stop_event.clear()  # Clear the stop event
         _interval = interval if interval is not None else self.interval
         if not _interval:
             print("MICT cycle started without an interval.  Call next_stage() manually.")
             return None
 
+        period_s = _interval / 1000  # Hoisted: one division, not one per tick.
+        batch = self.batch
+        batch_period_s = period_s * batch
+
+        if self.scheduler == 'shared':
+            # Register with the process-wide scheduler thread instead of
+            # spawning a dedicated one: N instances share a single thread
+            # and their wakeups are coalesced into one deadline heap.
+            self._tick_handle = _get_shared_scheduler().schedule(self._shared_tick, batch_period_s)
+            return None
+
+        if self._compiled_cycle is None:
+            # Specialize once per instance; stages are frozen at config time.
+            self._compiled_cycle = self._compile_cycle_driver()
+
         def run_cycle():
-            while not self._stop_event.is_set():  # Use the event to check for stopping
-                self.next_stage()
-                time.sleep(_interval / 1000)
+            # Hoist bound methods once: at sub-ms intervals the attribute
+            # lookups would otherwise dominate the per-tick cost.
+            next_stage = self.next_stage
+            stop_wait = self._stop_event.wait
+            monotonic = time.monotonic
+            run_one_cycle = self._compiled_cycle
+            # Schedule against monotonic deadlines so the stage's own runtime
+            # doesn't accumulate as drift, and wait on the stop event so
+            # stop_cycle() interrupts the pause instead of sleeping it out.
+            next_deadline = monotonic()
+            pending = batch
+
+            def pace():
+                # Called once per stage; only every `batch`-th call actually
+                # waits, amortizing the deadline arithmetic across the batch.
+                # Returns True when a stop was requested.
+                nonlocal pending, next_deadline
+                pending -= 1
+                if pending:
+                    return False
+                pending = batch
+                next_deadline += batch_period_s
+                delay = next_deadline - monotonic()
+                if delay > 0:
+                    return stop_wait(delay)
+                return False
+
+            while not self._stopped:  # Plain slot read; no method call per tick
+                if self.current_stage_index == 0:
+                    # Aligned at the top of the cycle: run the specialized
+                    # straight-line driver for a full pass.
+                    if run_one_cycle(self, pace):
+                        break
+                else:
+                    # Mid-cycle (e.g. after a stage error): step stage-by-stage
+                    # until the cycle realigns at stage 0.
+                    next_stage()
+                    if pace():
+                        break
 
         self.interval_id = threading.Thread(target=run_cycle)
         self.interval_id.daemon = True
         self.interval_id.start()
         return self.interval_id
 
+    def _shared_tick(self) -> None:
+        """Runs one batch of stages; the shared scheduler calls this periodically."""
+        if self._stopped:
+            return
+        for _ in range(self.batch):
+            self.next_stage()
+
     def stop_cycle(self) -> None:
         """Stops the MICT cycle."""
-        self._stop_event.set()  # Signal the thread to stop
+        self._stopped = True  # Seen by the cycle loop on its next iteration
+        self._stop_event.set()  # Wake the thread if it is mid-sleep
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()  # Deregister from the shared scheduler
+            self._tick_handle = None
         self.interval_id = None
 
 
-    def set_state(self, new_state: Dict) -> None:
+    def force_redraw(self) -> None:
+        """Calls updateUI with the current state, bypassing change detection."""
+        self.updateUI(self.current_state, self.get_current_stage())
+
+    def set_state(self, new_state: Any) -> None:
         """
         Sets the current state of the system.
 
         Args:
-            new_state (dict): The new state.
+            new_state (dict or object): The new state.
         """
-        self.previous_state = self.current_state.copy() # Save previous state
+        if new_state is not self.current_state:
+            # The caller handed us a different object, so the old state can be
+            # saved by reference without copying.
+            self.previous_state = self.current_state
+        else:
+            self.previous_state = _snapshot(self.current_state) # Save previous state
         self.current_state = new_state
         self.updateUI(self.current_state, self.get_current_stage())
 
@@ -148,6 +667,158 @@ class MICT:
         """Resets the MICT cycle to its initial state."""
         self.current_stage_index = 0
         self.previous_state = None #Reset previous state
-        self.current_state = self.config['initialState'].copy()  # Use initial state from config
+        self.current_state = _snapshot(self._build_initial_state(self.config))  # Use initial state from config
         self.stop_cycle()
         self.updateUI(self.current_state, self.get_current_stage())
+
+class MICTSwarm:
+    """
+    Drives many identical MICT cycles as one vectorized batch.
+
+    Where MICT runs one instance per next_stage call, MICTSwarm stores the
+    states of N instances as a single numpy structured array and executes each
+    stage function once over the whole array, so the Python dispatch cost per
+    tick is amortized across all N instances. Stage functions receive the
+    array and update it in place (e.g. states['count'] += 1); all instances
+    advance through the cycle in lockstep. Requires the optional numpy package.
+
+    Args:
+        config (dict): A dictionary containing configuration options:
+            'stages', 'size' (number of instances), 'stateDtype' (numpy dtype
+            for one instance's state), and optionally 'stageFunctions',
+            'updateUI', 'errorHandler', and 'interval' as in MICT.
+
+    Attributes:
+        stages (list): A list of stage names (strings) defining the MICT cycle.
+        size (int): The number of instances in the swarm.
+        states (numpy.ndarray): Structured array holding all instance states.
+        current_stage_index (int): The index of the current stage.
+        interval (int): The interval (in milliseconds) between cycle iterations.
+    """
+    __slots__ = (
+        'stages', 'size', 'states', 'current_stage_index', 'updateUI',
+        'stage_functions', 'interval_id', 'interval', 'error_handler',
+        '_error_handler', '_stopped', '_stop_event', '_stage_name_by_idx',
+        '_stage_fn_by_idx', '_n_stages', 'config',
+    )
+
+    def __init__(self, config: Dict):
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ConfigurationError(
+                "MICTSwarm requires the optional 'numpy' package."
+            ) from exc
+        if not isinstance(config, dict):
+            raise TypeError("MICTSwarm constructor requires a configuration object.")
+        if not isinstance(config.get('stages'), list) or not config['stages']:
+            raise TypeError("MICTSwarm configuration must include a 'stages' list with at least one stage.")
+        if not isinstance(config.get('size'), int) or config['size'] < 1:
+            raise TypeError("MICTSwarm configuration must include a positive integer 'size'.")
+        if 'stateDtype' not in config:
+            raise TypeError("MICTSwarm configuration must include a 'stateDtype'.")
+
+        self.stages: List[str] = [sys.intern(stage) for stage in config['stages']]
+        self.size: int = config['size']
+        self.states = np.zeros(self.size, dtype=config['stateDtype'])
+        initial = config.get('initialState')
+        if isinstance(initial, dict):
+            for field, value in initial.items():
+                self.states[field] = value
+        self.current_stage_index: int = 0
+        self.updateUI: Optional[Callable] = config.get('updateUI', None)
+        self.stage_functions: Dict[str, Callable] = {
+            sys.intern(name): func for name, func in config.get('stageFunctions', {}).items()
+        }
+        self.interval_id: Optional[threading.Thread] = None
+        self.interval: int = config.get('interval', 0)
+        self.error_handler: Optional[Callable] = config.get('errorHandler', None)
+        self._error_handler: Callable = self.error_handler or _default_error_handler
+        self._stopped: bool = False
+        self._stop_event: threading.Event = threading.Event()
+
+        for stage_name, func in self.stage_functions.items():
+            if stage_name not in self.stages:
+                raise TypeError(f"Invalid stage name '{stage_name}' in stageFunctions. Must be one of: {', '.join(self.stages)}")
+            if not callable(func):
+                raise TypeError(f"stageFunctions['{stage_name}'] must be a function.")
+
+        self._stage_name_by_idx: List[str] = list(self.stages)
+        self._stage_fn_by_idx: List[Optional[Callable]] = [
+            self.stage_functions.get(name) for name in self.stages
+        ]
+        self._n_stages: int = len(self.stages)
+        self.config = config
+
+    def get_current_stage(self) -> str:
+        """Returns the name of the current stage."""
+        return self.stages[self.current_stage_index]
+
+    def next_stage(self) -> None:
+        """Executes the next stage across the whole swarm."""
+        idx = self.current_stage_index
+        stage_function = self._stage_fn_by_idx[idx]
+        states = self.states
+
+        if stage_function is not None:
+            try:
+                # One vectorized call updates all instances in place.
+                stage_function(states)
+            except Exception as error:
+                self._error_handler(error, self._stage_name_by_idx[idx], states)
+                return  # Don't proceed to the next stage if there's an error
+
+        idx += 1
+        if idx == self._n_stages:
+            idx = 0
+        self.current_stage_index = idx
+        if self.updateUI is not None:
+            self.updateUI(states, self._stage_name_by_idx[idx])
+
+    def start_cycle(self, interval: Optional[int] = None) -> Optional[threading.Thread]:
+        """
+        Starts the swarm cycle on a background thread.
+
+        Args:
+            interval (int, optional): Milliseconds between cycle iterations;
+                defaults to the configured interval. If 0 or None, the cycle
+                will not run automatically; `next_stage` must be called manually.
+
+        Returns:
+            threading.Thread or None: The thread object, or None without an interval.
+        """
+        if self.interval_id:
+            print("MICT swarm cycle is already running.  Stopping the previous cycle.")
+            self.stop_cycle()
+
+        self._stopped = False
+        self._stop_event.clear()
+        _interval = interval if interval is not None else self.interval
+        if not _interval:
+            print("MICT swarm cycle started without an interval.  Call next_stage() manually.")
+            return None
+
+        period_s = _interval / 1000
+
+        def run_cycle():
+            next_stage = self.next_stage
+            stop_wait = self._stop_event.wait
+            monotonic = time.monotonic
+            next_deadline = monotonic()
+            while not self._stopped:
+                next_stage()
+                next_deadline += period_s
+                delay = next_deadline - monotonic()
+                if delay > 0:
+                    stop_wait(delay)
+
+        self.interval_id = threading.Thread(target=run_cycle)
+        self.interval_id.daemon = True
+        self.interval_id.start()
+        return self.interval_id
+
+    def stop_cycle(self) -> None:
+        """Stops the swarm cycle."""
+        self._stopped = True
+        self._stop_event.set()  # Wake the thread if it is mid-sleep
+        self.interval_id = None
@@ -0,0 +1,64 @@
+# slots_example.py
+#
+# Same counter cycle as mict_python_example.py, but with the state held in a
+# slots dataclass instead of a dict. Attribute access (state.count) is a fixed
+# slot load with no hashing, and incrementing in place avoids rebuilding a
+# dict on every tick.
+import time
+from dataclasses import dataclass
+
+from mict_framework import MICT
+
+@dataclass(slots=True)
+class CounterState:
+    count: int = 0
+
+def update_ui(state, stage):
+    print(f"Current Stage: {stage}, State: {state}")
+
+def mapping(state):
+    print("Mapping stage:", state)
+    return state  # No change in this example
+
+def iteration(state):
+    print("Iteration stage:", state)
+    state.count += 1  # Increment count in place
+    return state
+
+def checking(state):
+    print("Checking stage:", state)
+    if state.count > 5:
+        raise ValueError("Count exceeded limit!")  # Example error
+    return state
+
+def transformation(state):
+    print("Transformation stage:", state)
+    return state  # No change in this example
+
+# Create a MICT instance
+config = {
+    "stages": ["Mapping", "Iteration", "Checking", "Transformation"],
+    "stateSchema": CounterState,
+    "initialState": {"count": 0},  # Start with count = 0
+    "updateUI": update_ui,
+    "stageFunctions": {
+        "Mapping": mapping,
+        "Iteration": iteration,
+        "Checking": checking,
+        "Transformation": transformation
+    },
+    "interval": 1000  # Run every 1000ms (1 second)
+}
+
+mict_cycle = MICT(config)
+
+# Start the cycle
+mict_cycle.start_cycle()
+# Keep the main thread alive for a while to let the cycle run
+
+try:
+    time.sleep(10) #Keep the main thread alive
+except KeyboardInterrupt:
+    pass # Allow the use of CTRL-C to exit.
+finally:
+    mict_cycle.stop_cycle()  # Stop in the main thread.